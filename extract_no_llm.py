@@ -4,9 +4,102 @@ Uses pdfplumber for PDF text/table extraction + regex pattern matching
 """
 
 import pdfplumber
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdftypes import resolve1
+import os
 import re
-from typing import Dict, List, Any
-from datetime import datetime
+import calendar
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from functools import lru_cache, partial
+from typing import Dict, List, Any, Optional
+from datetime import date, datetime
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# Statements with at least this many pages are read with a process pool
+PARALLEL_PAGE_THRESHOLD = 8
+
+# The statement opened once per pool worker (see _init_worker)
+_worker_pdf = None
+
+# Regex patterns are compiled once at import time and reused for every page/row
+_KNOWN_BANKS = ('CHASE', 'WELLS FARGO', 'BANK OF AMERICA', 'CITIBANK', 'CAPITAL ONE', 'TD BANK', 'PNC')
+_BANK_RE = re.compile(r'(CHASE|Wells Fargo|Bank of America|Citibank|Capital One|TD Bank|PNC)', re.IGNORECASE)
+
+# Metadata patterns, keyed by field. Each pattern starts with a literal anchor
+# so all of them can be located in one pass over the text (see _scan_metadata).
+_HOLDER_RES = {k: re.compile(p, re.IGNORECASE) for k, p in {
+    "account_holder": r'Account Holder:\s*([A-Za-z\s]+)',
+    "name": r'Name:\s*([A-Za-z\s]+)',
+    "customer": r'Customer:\s*([A-Za-z\s]+)',
+}.items()}
+
+_ACCT_RES = {k: re.compile(p, re.IGNORECASE) for k, p in {
+    "account_number": r'Account Number:\s*(\*+\d+)',
+    "account_no": r'Account No:\s*(\*+\d+)',
+    "acct": r'Acct#\s*(\*+\d+)',
+}.items()}
+
+# Pattern: "January 1, 2024 - January 31, 2024"
+_DATE_RANGE_RE = re.compile(r'([A-Za-z]+\s+\d{1,2},?\s+\d{4})\s*[-–]\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})')
+
+_SUMMARY_RES = {k: re.compile(p, re.IGNORECASE) for k, p in {
+    "opening_balance": r'Opening Balance[^$]*\$?([\d,]+\.?\d*)',
+    "closing_balance": r'Closing Balance[^$]*\$?([\d,]+\.?\d*)',
+    "total_credits": r'Total Credits[^$]*\$?([\d,]+\.?\d*)',
+    "total_debits": r'Total Debits[^$]*\$?([\d,]+\.?\d*)',
+}.items()}
+
+# Date shapes handled by normalize_date without going through strptime
+_MDY_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+_MONTH_DAY_YEAR_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2})\s+(\d{4})')
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_MONTHS = {
+    **{name.lower(): i for i, name in enumerate(calendar.month_name) if name},
+    **{name.lower(): i for i, name in enumerate(calendar.month_abbr) if name},
+}
+
+_META_ANCHORS = {
+    "account_holder": 'Account Holder:',
+    "name": 'Name:',
+    "customer": 'Customer:',
+    "account_number": 'Account Number:',
+    "account_no": 'Account No:',
+    "acct": 'Acct#',
+    "opening_balance": 'Opening Balance',
+    "closing_balance": 'Closing Balance',
+    "total_credits": 'Total Credits',
+    "total_debits": 'Total Debits',
+}
+_META_RES = {**_HOLDER_RES, **_ACCT_RES, **_SUMMARY_RES}
+_META_RE = re.compile(
+    '|'.join(f'(?P<{k}>{re.escape(a)})' for k, a in _META_ANCHORS.items()),
+    re.IGNORECASE,
+)
+
+# Optional Aho-Corasick automaton over the same anchors (pip install pyahocorasick)
+_META_AUTOMATON = None
+if ahocorasick is not None:
+    _META_AUTOMATON = ahocorasick.Automaton()
+    for _key, _anchor in _META_ANCHORS.items():
+        _META_AUTOMATON.add_word(_anchor.lower(), (_key, len(_anchor)))
+    _META_AUTOMATON.make_automaton()
+
+# Column headers that identify a transaction table
+_HEADER_KEYS = ('date', 'description', 'amount', 'balance')
+
+_AMOUNT_RE = re.compile(r'[\d,]+\.?\d*')
+_SIGNED_AMOUNT_RE = re.compile(r'\s*(\()?\s*(-)?\s*\$?\s*([\d,]+\.?\d*)\s*\)?\s*(DR|CR)?', re.IGNORECASE)
+
 
 def extract_bank_statement(pdf_path: str) -> Dict[str, Any]:
     """
@@ -27,79 +120,395 @@ def extract_bank_statement(pdf_path: str) -> Dict[str, Any]:
         "transactions": []
     }
     
-    with pdfplumber.open(pdf_path) as pdf:
-        full_text = ""
+    # Metadata only needs plain text, which pypdfium2 (when installed) extracts much
+    # faster than pdfminer; pdfplumber is then only used for the transaction table
+    fast_text = extract_text_pdfium(pdf_path)
+    if fast_text is not None:
+        extract_metadata(fast_text, result)
+    
+    # Statements almost always fit on the first page, so only that page is opened up front
+    with pdfplumber.open(pdf_path, pages=[1]) as pdf:
+        page_count = _page_count(pdf)
+        # A pool only pays for its process startup when there is more than one core
+        if page_count >= PARALLEL_PAGE_THRESHOLD and (os.cpu_count() or 1) > 1:
+            pages = _extract_pages_parallel(pdf_path, page_count, need_text=fast_text is None)
+        else:
+            pages = _extract_pages(pdf, pdf_path, page_count)
         
-        for page in pdf.pages:
-            # Extract text
-            text = page.extract_text() or ""
-            full_text += text + "\n"
-            
-            # Extract tables
-            tables = page.extract_tables()
-            
-            for table in tables:
-                # Check if this looks like a transaction table
-                if table and len(table) > 1:
-                    headers = [str(cell).lower() if cell else "" for cell in table[0]]
-                    
-                    # Look for transaction-like headers
-                    if any(h in headers for h in ['date', 'description', 'amount', 'balance']):
-                        result["transactions"] = parse_transaction_table(table)
+        text_chunks = []
+        scanned = False
         
-        # Extract metadata from text using regex patterns
-        result["bank_name"] = extract_bank_name(full_text)
-        result["account_holder"] = extract_account_holder(full_text)
-        result["account_number"] = extract_account_number(full_text)
-        result["statement_period"] = extract_statement_period(full_text)
-        result["summary"] = extract_summary(full_text)
+        with closing(pages):
+            for get_text, get_tables in pages:
+                # Extract text (unless pypdfium2 already provided it)
+                if fast_text is None:
+                    text_chunks.append(get_text() or "")
+                
+                # Extract tables (the costliest pdfplumber call, so only until transactions are found)
+                if not result["transactions"]:
+                    tables = get_tables()
+                    
+                    for table in tables:
+                        # Check if this looks like a transaction table
+                        if table and len(table) > 1:
+                            # Look for transaction-like headers, stopping at the first hit
+                            if any(str(cell).lower() in _HEADER_KEYS for cell in table[0] if cell):
+                                result["transactions"] = parse_transaction_table(table)
+                                if result["transactions"]:
+                                    break
+                
+                # Stop reading pages once transactions and all metadata have been found
+                if result["transactions"]:
+                    if fast_text is not None:
+                        break
+                    # After the first scan, only rescan when the new page could fill a missing field
+                    if not scanned or _may_fill_metadata(text_chunks[-1], result):
+                        extract_metadata("\n".join(text_chunks), result)
+                        scanned = True
+                        if is_complete(result):
+                            break
+            else:
+                if fast_text is None:
+                    extract_metadata("\n".join(text_chunks), result)
     
     return result
 
 
+def _page_count(pdf) -> int:
+    """Read the page count from the document catalog without building every page."""
+    try:
+        count = int(resolve1(resolve1(pdf.doc.catalog["Pages"])["Count"]))
+        if count > 0:
+            return count
+    except Exception:
+        pass
+    # Missing or malformed /Count: walk the page tree instead
+    return sum(1 for _ in PDFPage.create_pages(pdf.doc))
+
+
+def _extract_pages(pdf, pdf_path: str, page_count: int):
+    """
+    Yield (get_text, get_tables) for every page. pdf only holds the first
+    page; the remaining pages are opened only if the caller keeps reading.
+    """
+    for page in pdf.pages:
+        yield page.extract_text, partial(extract_tables, page)
+    
+    if page_count > 1:
+        with pdfplumber.open(pdf_path, pages=range(2, page_count + 1)) as rest:
+            for page in rest.pages:
+                yield page.extract_text, partial(extract_tables, page)
+
+
+def _extract_pages_parallel(pdf_path: str, page_count: int, need_text: bool = True):
+    """
+    Yield (get_text, get_tables) for every page, extracted in a process pool.
+    Without need_text the workers skip text extraction and get_text returns "".
+    Each worker opens the PDF once and is then only sent page indices.
+    Pages still pending when the generator is closed are cancelled.
+    """
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(pdf_path,),
+    ) as executor:
+        futures = [executor.submit(_process_page, i, need_text) for i in range(page_count)]
+        try:
+            for future in futures:
+                text, tables = future.result()
+                yield partial(str, text), partial(list, tables)
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def extract_text_pdfium(pdf_path: str) -> Optional[str]:
+    """Extract the text of every page with pypdfium2, or None if it is unavailable."""
+    if pdfium is None:
+        return None
+    try:
+        pdf = pdfium.PdfDocument(pdf_path)
+    except pdfium.PdfiumError:
+        return None
+    try:
+        return "\n".join(
+            page.get_textpage().get_text_range().replace('\r\n', '\n') for page in pdf
+        )
+    finally:
+        pdf.close()
+
+
+def _init_worker(pdf_path: str) -> None:
+    """Open the PDF once per worker process."""
+    global _worker_pdf
+    _worker_pdf = pdfplumber.open(pdf_path)
+
+
+def _process_page(page_index: int, need_text: bool = True) -> tuple:
+    """Extract text (if needed) and tables from one page of the worker's PDF (runs in a worker process)."""
+    page = _worker_pdf.pages[page_index]
+    text = (page.extract_text() or "") if need_text else ""
+    return text, extract_tables(page)
+
+
+def extract_tables(page) -> List[List[List[str]]]:
+    """
+    Extract the tables of a page. A Date/Description/Amount/Balance table is
+    rebuilt from the page's words, which is much cheaper than pdfplumber's
+    table finder; anything else (or a layout the rebuild cannot place) falls
+    back to page.extract_tables().
+    """
+    table = _find_transaction_table(page.extract_words())
+    if table:
+        return [table]
+    return page.extract_tables()
+
+
+def _find_transaction_table(words: List[Dict[str, Any]]) -> List[List[str]]:
+    """
+    Rebuild the transaction table from positioned words.
+    The header row fixes the columns and every following line is split into
+    phrases which go to the nearest header. A line with a date starts a row,
+    a line with only description text is a wrapped description and joins the
+    row it sits closest to. The table ends at the first line whose leftmost
+    column is not a date, at other undated text (a footer), or at a gap wider
+    than the table's own row spacing. Returns None if such text sits between
+    two rows, if the header has columns besides the four known ones, or if a
+    phrase does not fit inside one column, so the caller falls back to pdfplumber.
+    """
+    lines = _group_lines(words)
+    for n, columns in enumerate(lines):
+        if {w["text"].lower() for w in columns}.issuperset(_HEADER_KEYS):
+            break
+    else:
+        return None
+    
+    # Any other header word is a column whose cells would land in a known one
+    if len(columns) != len(_HEADER_KEYS):
+        return None
+    
+    description = [w["text"].lower() for w in columns].index('description')
+    rows = []
+    pending = []  # undated lines not yet given to a row
+    prev_bottom = max(w["bottom"] for w in lines[n])
+    widest_gap = 0
+    
+    for k in range(n + 1, len(lines)):
+        line = lines[k]
+        top = min(w["top"] for w in line)
+        bottom = max(w["bottom"] for w in line)
+        gap = top - prev_bottom
+        
+        cells, fits = _row_cells(line, columns)
+        if cells[0]:
+            if not _is_date(" ".join(cells[0])):
+                break
+            if not fits:
+                return None
+            row = {"cells": [" ".join(cell) for cell in cells], "parts": [], "top": top, "bottom": bottom}
+            if cells[description]:
+                row["parts"].append((top, row["cells"][description]))
+            _attach_continuations(rows[-1] if rows else None, pending, row)
+            pending = []
+            rows.append(row)
+        else:
+            if rows and gap > 1.5 * max(widest_gap, bottom - top):
+                break
+            if not fits or any(cell for i, cell in enumerate(cells) if i != description):
+                # Not a wrapped description: the table ends here, unless another row follows
+                following = _row_cells(lines[k + 1], columns)[0] if k + 1 < len(lines) else None
+                if following and following[0] and _is_date(" ".join(following[0])):
+                    return None
+                break
+            pending.append({"text": " ".join(cells[description]), "top": top, "bottom": bottom})
+        
+        widest_gap = max(widest_gap, gap)
+        prev_bottom = bottom
+    
+    if not rows:
+        return None
+    rows[-1]["parts"].extend((p["top"], p["text"]) for p in pending)
+    
+    table = [[w["text"] for w in columns]]
+    for row in rows:
+        row["cells"][description] = "\n".join(text for _, text in sorted(row["parts"]))
+        table.append(row["cells"])
+    return table
+
+
+def _row_cells(line: List[Dict[str, Any]], columns: List[Dict[str, Any]]) -> tuple:
+    """
+    Split a line into phrases and collect them under their nearest header.
+    Returns (cells, fits); fits is False if a phrase reaches under a
+    neighbouring header, i.e. does not sit inside a single column.
+    """
+    cells = [[] for _ in columns]
+    fits = True
+    for phrase in _group_phrases(line):
+        i = _nearest_column(phrase, columns)
+        if (i > 0 and phrase["x0"] <= columns[i - 1]["x1"]) or \
+                (i + 1 < len(columns) and phrase["x1"] >= columns[i + 1]["x0"]):
+            fits = False
+        cells[i].append(phrase["text"])
+    return cells, fits
+
+
+def _attach_continuations(previous, pending: List[Dict[str, Any]], row: Dict[str, Any]) -> None:
+    """
+    Give the undated lines between two dated rows to their rows: the widest
+    vertical gap is the row boundary, lines above it continue the previous
+    row (ties included) and lines below it belong to the new one.
+    """
+    if previous is None:
+        split = 0
+    else:
+        boxes = [previous] + pending + [row]
+        gaps = [b["top"] - a["bottom"] for a, b in zip(boxes, boxes[1:])]
+        split = len(gaps) - 1 - gaps[::-1].index(max(gaps))
+        previous["parts"].extend((p["top"], p["text"]) for p in pending[:split])
+    row["parts"].extend((p["top"], p["text"]) for p in pending[split:])
+
+
+def _is_date(text: str) -> bool:
+    """Check whether text is a date normalize_date understands."""
+    return bool(_ISO_DATE_RE.fullmatch(normalize_date(text)))
+
+
+def _group_lines(words: List[Dict[str, Any]], tolerance: float = 3) -> List[List[Dict[str, Any]]]:
+    """Group words into lines by their vertical position, each sorted left to right."""
+    lines = []
+    for word in sorted(words, key=lambda w: (w["top"], w["x0"])):
+        if lines and abs(word["top"] - lines[-1][0]["top"]) <= tolerance:
+            lines[-1].append(word)
+        else:
+            lines.append([word])
+    return [sorted(line, key=lambda w: w["x0"]) for line in lines]
+
+
+def _group_phrases(line: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Merge words separated by less than half their height (a space) into phrases."""
+    phrases = []
+    for word in line:
+        last = phrases[-1] if phrases else None
+        if last and word["x0"] - last["x1"] < (last["bottom"] - last["top"]) / 2:
+            last["text"] += " " + word["text"]
+            last["x1"] = word["x1"]
+        else:
+            phrases.append({k: word[k] for k in ("text", "x0", "x1", "top", "bottom")})
+    return phrases
+
+
+def _nearest_column(phrase: Dict[str, Any], columns: List[Dict[str, Any]]) -> int:
+    """Index of the header whose horizontal span is closest to the phrase."""
+    distances = [max(c["x0"] - phrase["x1"], phrase["x0"] - c["x1"], 0) for c in columns]
+    return distances.index(min(distances))
+
+
+def extract_metadata(text: str, result: Dict[str, Any]) -> None:
+    """Fill the metadata fields of result from text using regex patterns."""
+    matches = _scan_metadata(text)
+    result["bank_name"] = extract_bank_name(text)
+    result["account_holder"] = extract_account_holder(text, matches)
+    result["account_number"] = extract_account_number(text, matches)
+    result["statement_period"] = extract_statement_period(text)
+    result["summary"] = extract_summary(text, matches)
+
+
+def is_complete(result: Dict[str, Any]) -> bool:
+    """Check whether transactions and every metadata field have been found."""
+    return bool(
+        result["transactions"]
+        and result["bank_name"]
+        and result["account_holder"]
+        and result["account_number"]
+        and all(v is not None for v in result["statement_period"].values())
+        and all(v is not None for v in result["summary"].values())
+    )
+
+
+def _may_fill_metadata(text: str, result: Dict[str, Any]) -> bool:
+    """
+    Check whether text holds the anchor of a metadata field result is still
+    missing (or a date range while the statement period is missing).
+    """
+    if not result["bank_name"]:
+        return bool(text.strip())
+    if None in result["statement_period"].values() and _DATE_RANGE_RE.search(text):
+        return True
+    missing = {k for k, v in result["summary"].items() if v is None}
+    if not result["account_holder"]:
+        missing.update(_HOLDER_RES)
+    if not result["account_number"]:
+        missing.update(_ACCT_RES)
+    return any(key in missing for key, _ in _iter_anchors(text))
+
+
+def _scan_metadata(text: str) -> Dict[str, Any]:
+    """
+    Find the first match of every metadata pattern in a single pass.
+    The anchors are located with one alternation scan and each full pattern
+    is only tried at its anchor offsets.
+    """
+    matches = {}
+    for key, start in _iter_anchors(text):
+        if key in matches:
+            continue
+        match = _META_RES[key].match(text, start)
+        if match:
+            matches[key] = match
+            if len(matches) == len(_META_RES):
+                break
+    return matches
+
+
+def _iter_anchors(text: str):
+    """Yield (field, offset) for every metadata anchor found in the text."""
+    if _META_AUTOMATON is not None:
+        lowered = text.lower()
+        # Offsets are only comparable if lowercasing kept the length intact
+        if len(lowered) == len(text):
+            for end, (key, length) in _META_AUTOMATON.iter(lowered):
+                yield key, end - length + 1
+            return
+    for hit in _META_RE.finditer(text):
+        yield hit.lastgroup, hit.start()
+
+
 def extract_bank_name(text: str) -> str:
     """Extract bank name from text (usually in the first few lines)."""
-    lines = text.strip().split('\n')
-    if lines:
-        # Bank name is typically the first line
-        first_line = lines[0].strip()
-        # Common bank names pattern
-        bank_patterns = [
-            r'(CHASE|Wells Fargo|Bank of America|Citibank|Capital One|TD Bank|PNC)',
-        ]
-        for pattern in bank_patterns:
-            match = re.search(pattern, first_line, re.IGNORECASE)
-            if match:
-                return match.group(1).upper()
-        return first_line.split()[0] if first_line else None
-    return None
+    # Bank name is typically the first line
+    first_line = text.lstrip().partition('\n')[0].strip()
+    
+    # Known banks usually start the line, which a prefix check settles without regex
+    upper = first_line.upper()
+    for bank in _KNOWN_BANKS:
+        if upper.startswith(bank):
+            return bank
+    
+    # Common bank names pattern
+    match = _BANK_RE.search(first_line)
+    if match:
+        return match.group(1).upper()
+    return first_line.split()[0] if first_line else None
 
 
-def extract_account_holder(text: str) -> str:
+def extract_account_holder(text: str, matches: Dict[str, Any] = None) -> str:
     """Extract account holder name."""
-    patterns = [
-        r'Account Holder:\s*([A-Za-z\s]+)',
-        r'Name:\s*([A-Za-z\s]+)',
-        r'Customer:\s*([A-Za-z\s]+)',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
+    if matches is None:
+        matches = _scan_metadata(text)
+    for key in _HOLDER_RES:
+        if key in matches:
+            return matches[key].group(1).strip()
     return None
 
 
-def extract_account_number(text: str) -> str:
+def extract_account_number(text: str, matches: Dict[str, Any] = None) -> str:
     """Extract masked account number."""
-    patterns = [
-        r'Account Number:\s*(\*+\d+)',
-        r'Account No:\s*(\*+\d+)',
-        r'Acct#\s*(\*+\d+)',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            return match.group(1)
+    if matches is None:
+        matches = _scan_metadata(text)
+    for key in _ACCT_RES:
+        if key in matches:
+            return matches[key].group(1)
     return None
 
 
@@ -107,9 +516,7 @@ def extract_statement_period(text: str) -> Dict[str, str]:
     """Extract statement period dates."""
     result = {"from": None, "to": None}
     
-    # Pattern: "January 1, 2024 - January 31, 2024"
-    date_range_pattern = r'([A-Za-z]+\s+\d{1,2},?\s+\d{4})\s*[-–]\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})'
-    match = re.search(date_range_pattern, text)
+    match = _DATE_RANGE_RE.search(text)
     
     if match:
         try:
@@ -121,9 +528,26 @@ def extract_statement_period(text: str) -> Dict[str, str]:
     return result
 
 
+@lru_cache(maxsize=1024)
 def normalize_date(date_str: str) -> str:
     """Convert date string to YYYY-MM-DD format."""
     date_str = date_str.replace(',', '')
+    
+    # Fast path: "01/05/2024" and "January 5 2024" / "Jan 5 2024"
+    match = _MDY_RE.fullmatch(date_str)
+    if match:
+        month, day, year = match.groups()
+    else:
+        match = _MONTH_DAY_YEAR_RE.fullmatch(date_str)
+        if match:
+            month = _MONTHS.get(match.group(1).lower())
+            day, year = match.group(2), match.group(3)
+    if match and month:
+        try:
+            return date(int(year), int(month), int(day)).isoformat()
+        except ValueError:
+            pass
+    
     for fmt in ['%B %d %Y', '%b %d %Y', '%m/%d/%Y']:
         try:
             dt = datetime.strptime(date_str, fmt)
@@ -133,7 +557,7 @@ def normalize_date(date_str: str) -> str:
     return date_str
 
 
-def extract_summary(text: str) -> Dict[str, float]:
+def extract_summary(text: str, matches: Dict[str, Any] = None) -> Dict[str, float]:
     """Extract account summary values."""
     summary = {
         "opening_balance": None,
@@ -142,18 +566,11 @@ def extract_summary(text: str) -> Dict[str, float]:
         "total_debits": None,
     }
     
-    # Pattern for dollar amounts
-    amount_pattern = r'\$?([\d,]+\.?\d*)'
-    
-    patterns = {
-        "opening_balance": r'Opening Balance[^$]*\$?([\d,]+\.?\d*)',
-        "closing_balance": r'Closing Balance[^$]*\$?([\d,]+\.?\d*)',
-        "total_credits": r'Total Credits[^$]*\$?([\d,]+\.?\d*)',
-        "total_debits": r'Total Debits[^$]*\$?([\d,]+\.?\d*)',
-    }
+    if matches is None:
+        matches = _scan_metadata(text)
     
-    for key, pattern in patterns.items():
-        match = re.search(pattern, text, re.IGNORECASE)
+    for key in _SUMMARY_RES:
+        match = matches.get(key)
         if match:
             try:
                 summary[key] = float(match.group(1).replace(',', ''))
@@ -175,60 +592,66 @@ def parse_transaction_table(table: List[List[str]]) -> List[Dict[str, Any]]:
     # Find column indices
     col_map = {}
     for i, h in enumerate(headers):
-        if 'date' in h:
-            col_map['date'] = i
-        elif 'description' in h:
-            col_map['description'] = i
-        elif 'amount' in h:
-            col_map['amount'] = i
-        elif 'balance' in h:
-            col_map['balance'] = i
+        if not h:
+            continue
+        for key in _HEADER_KEYS:
+            if key in h:
+                col_map[key] = i
+                break
     
     # Process data rows
-    for row in table[1:]:
-        if not row or all(not cell for cell in row):
-            continue
-            
-        trans = {
-            "date": None,
-            "description": None,
-            "amount": None,
-            "balance": None,
-            "type": None
-        }
-        
-        # Extract values
-        if 'date' in col_map:
-            trans["date"] = normalize_date(str(row[col_map['date']] or ""))
-        
-        if 'description' in col_map:
-            trans["description"] = str(row[col_map['description']] or "").strip()
-        
-        if 'amount' in col_map:
-            amount_str = str(row[col_map['amount']] or "")
-            trans["amount"], trans["type"] = parse_amount(amount_str)
-        
-        if 'balance' in col_map:
-            balance_str = str(row[col_map['balance']] or "")
-            trans["balance"] = parse_balance(balance_str)
-        
-        if trans["date"] or trans["description"]:
-            transactions.append(trans)
+    rows = [row for row in table[1:] if row and any(row)]
+    
+    # Parse one column at a time so each parser runs as a single map() over its cells
+    dates = descriptions = balances = [None] * len(rows)
+    amounts = [(None, None)] * len(rows)
+    
+    if 'date' in col_map:
+        dates = list(map(normalize_date, _column(rows, col_map['date'])))
+    
+    if 'description' in col_map:
+        descriptions = list(map(str.strip, _column(rows, col_map['description'])))
+    
+    if 'amount' in col_map:
+        amounts = list(map(parse_amount, _column(rows, col_map['amount'])))
+    
+    if 'balance' in col_map:
+        balances = list(map(parse_balance, _column(rows, col_map['balance'])))
+    
+    for txn_date, description, (amount, kind), balance in zip(dates, descriptions, amounts, balances):
+        if txn_date or description:
+            transactions.append({
+                "date": txn_date,
+                "description": description,
+                "amount": amount,
+                "balance": balance,
+                "type": kind
+            })
     
     return transactions
 
 
+def _column(rows: List[List[str]], index: int) -> List[str]:
+    """Return one column of a table as strings, with empty cells as ""."""
+    return [str(row[index] or "") for row in rows]
+
+
 def parse_amount(amount_str: str) -> tuple:
     """Parse amount string and determine if credit or debit."""
-    amount_str = amount_str.strip()
-    
-    # Check for negative indicator
-    is_debit = amount_str.startswith('-') or amount_str.startswith('($')
-    
-    # Extract numeric value
-    match = re.search(r'[\d,]+\.?\d*', amount_str.replace('$', ''))
+    # Sign, numeric value and DR/CR marker in one match ("-$5.00", "($5.00)", "$5.00 DR")
+    match = _SIGNED_AMOUNT_RE.match(amount_str)
     if match:
-        value = float(match.group().replace(',', ''))
+        paren, minus, number, marker = match.groups()
+        is_debit = bool(paren or minus) or (marker or "").upper() == 'DR'
+        value = float(number.replace(',', ''))
+        return (-value if is_debit else value, "debit" if is_debit else "credit")
+    
+    # Anything else with a number in it ("USD 5.00", "-€5.00", "-(5)") keeps its
+    # leading sign or trailing DR marker
+    value = _parse_number(amount_str)
+    if value is not None:
+        stripped = amount_str.strip()
+        is_debit = stripped.startswith(('-', '(')) or stripped[-2:].upper() == 'DR'
         return (-value if is_debit else value, "debit" if is_debit else "credit")
     
     return (None, None)
@@ -236,7 +659,19 @@ def parse_amount(amount_str: str) -> tuple:
 
 def parse_balance(balance_str: str) -> float:
     """Parse balance string to float."""
-    match = re.search(r'[\d,]+\.?\d*', balance_str.replace('$', ''))
+    return _parse_number(balance_str)
+
+
+def _parse_number(value: str) -> float:
+    """Parse a currency string like "$1,234.56", avoiding the regex engine for plain numbers."""
+    # Fast path: digits with thousands separators, wrapped in sign/"$"/parentheses only
+    whole, point, fraction = value.strip(' -($)').partition('.')
+    whole = whole.replace(',', '')
+    if whole.isdecimal() and (fraction.isdecimal() or not fraction):
+        return float(whole + point + fraction)
+    
+    # Anything else (trailing text, currency codes, ...) goes through the regex
+    match = _AMOUNT_RE.search(value.replace('$', ''))
     if match:
         return float(match.group().replace(',', ''))
     return None
@@ -273,7 +708,7 @@ def print_results(data: Dict[str, Any]):
         print("-" * 60)
         
         for t in data['transactions'][:10]:  # Show first 10
-            date = t.get('date', '')[:10] if t.get('date') else ''
+            txn_date = t.get('date', '')[:10] if t.get('date') else ''
             desc = (t.get('description') or '')[:33]
             amount = t.get('amount')
             balance = t.get('balance')
@@ -283,7 +718,7 @@ def print_results(data: Dict[str, Any]):
                 amount_str = f"-${abs(amount):,.2f}"
             balance_str = f"${balance:,.2f}" if balance else ''
             
-            print(f"{date:<12} {desc:<35} {amount_str:>10} {balance_str:>10}")
+            print(f"{txn_date:<12} {desc:<35} {amount_str:>10} {balance_str:>10}")
         
         if len(data['transactions']) > 10:
             print(f"... and {len(data['transactions']) - 10} more transactions")
@@ -299,7 +734,9 @@ if __name__ == "__main__":
     data = extract_bank_statement(pdf_path)
     print_results(data)
     
-    # Also output as JSON
+    # Also output as JSON (json.dump encodes incrementally instead of building one big string)
     import json
+    import sys
     print("\n📦 JSON Output:")
-    print(json.dumps(data, indent=2, default=str))
+    json.dump(data, sys.stdout, indent=2, default=str)
+    print()
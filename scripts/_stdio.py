@@ -0,0 +1,155 @@
+"""
+Shared stdin/stdout helpers for the PDF scripts.
+PDFs arrive base64 encoded on stdin and results go out as JSON on stdout;
+both directions are streamed in chunks so a large statement is never held
+in memory as base64 text and decoded bytes at the same time.
+
+With --worker the scripts instead stay alive and exchange length-prefixed
+JSON frames (4-byte big-endian length, then the UTF-8 body) until stdin closes.
+"""
+
+import base64
+import json
+import sys
+import tempfile
+from functools import partial
+
+
+def _stdlib_dumps(obj) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+# orjson serializes straight to UTF-8 bytes; the stdlib fallback matches it
+try:
+    from orjson import dumps as _orjson_dumps
+except ImportError:
+    _jdumps = _stdlib_dumps
+else:
+    def _jdumps(obj) -> bytes:
+        try:
+            return _orjson_dumps(obj)
+        except TypeError:
+            # orjson rejects lone surrogates (e.g. from a broken text layer),
+            # which the stdlib escapes as \udXXX
+            return _stdlib_dumps(obj)
+
+
+# Decoded PDFs up to this size stay in memory, larger ones spill to disk
+SPOOL_MAX_SIZE = 8 << 20
+
+# Chunk sizes: base64 text is decoded in multiples of 4 characters,
+# raw bytes are encoded in multiples of 3 bytes
+BASE64_READ_SIZE = 64 * 1024
+BASE64_ENCODE_SIZE = 48 * 1024
+
+# Everything outside the base64 alphabet (newlines, spaces, ...) is dropped,
+# the same as base64.b64decode does without validate=True
+_NON_BASE64 = bytes(sorted(
+    set(range(256))
+    - set(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=")
+))
+
+
+def read_base64_stream(stream=None):
+    """
+    Decode base64 from a binary stream (stdin by default) into a spooled file.
+    Returns the file rewound to the start, or None if the stream held no data.
+    Raises binascii.Error for a malformed payload.
+    """
+    stream = stream or sys.stdin.buffer
+    pdf_file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    pending = b""
+    received = False
+
+    for chunk in iter(partial(stream.read, BASE64_READ_SIZE), b""):
+        pending += chunk.translate(None, _NON_BASE64)
+        usable = len(pending) - len(pending) % 4
+        if usable:
+            received = True
+            pdf_file.write(base64.b64decode(pending[:usable]))
+            pending = pending[usable:]
+
+    if pending:
+        received = True
+        pdf_file.write(base64.b64decode(pending))
+
+    if not received:
+        pdf_file.close()
+        return None
+
+    pdf_file.seek(0)
+    return pdf_file
+
+
+def write_json(result: dict, stream=None) -> None:
+    """
+    Write result as a single line of JSON to a binary stream (stdout by default).
+    Binary file values are written as base64 strings, encoded chunk by chunk
+    instead of being built in memory first.
+    """
+    stream = stream or sys.stdout.buffer
+    files = {k: v for k, v in result.items() if hasattr(v, "read")}
+    body = _jdumps({k: v for k, v in result.items() if k not in files})
+
+    if not files:
+        stream.write(body + b"\n")
+        stream.flush()
+        return
+
+    # Reopen the object and append the file fields after the plain ones
+    stream.write(body[:-1])
+    separator = b"," if len(files) < len(result) else b""
+    for key, file in files.items():
+        stream.write(separator + _jdumps(key) + b':"')
+        file.seek(0)
+        for chunk in iter(partial(file.read, BASE64_ENCODE_SIZE), b""):
+            stream.write(base64.b64encode(chunk))
+        stream.write(b'"')
+        separator = b","
+    stream.write(b"}\n")
+    stream.flush()
+
+
+def read_frame(stream=None):
+    """
+    Read one length-prefixed frame (stdin by default).
+    Returns the frame body, or None once the stream is closed.
+    """
+    stream = stream or sys.stdin.buffer
+    header = stream.read(4)
+    if len(header) < 4:
+        return None
+    size = int.from_bytes(header, "big")
+    body = stream.read(size)
+    if len(body) < size:
+        return None  # peer went away mid-frame
+    return body
+
+
+def write_frame(result: dict, stream=None) -> None:
+    """Write result as one length-prefixed JSON frame (stdout by default)."""
+    stream = stream or sys.stdout.buffer
+    body = _jdumps(result)
+    stream.write(len(body).to_bytes(4, "big") + body)
+    stream.flush()
+
+
+def serve_frames(handle, stdin=None, stdout=None) -> None:
+    """
+    Worker loop: decode each request frame as JSON, pass the dict to handle
+    and write back the dict it returns, until stdin is closed.
+    A request that fails, or whose result cannot be serialized, gets an error
+    reply instead of stopping the worker.
+    """
+    stdin = stdin or sys.stdin.buffer
+    stdout = stdout or sys.stdout.buffer
+    while True:
+        body = read_frame(stdin)
+        if body is None:
+            break
+        # write_frame serializes before writing anything, so a result it cannot
+        # serialize still leaves the stream in step for the error reply
+        try:
+            write_frame(handle(json.loads(body)), stdout)
+        except Exception as e:
+            write_frame({"success": False, "error": f"Worker request failed: {e}"}, stdout)
@@ -14,6 +14,30 @@ import os
 import random
 from datetime import datetime, timedelta
 
+# Styles are identical for every generated statement, so build them once
+STYLES = getSampleStyleSheet()
+BANK_NAME_STYLE = ParagraphStyle('BankName', fontSize=20, fontName='Helvetica-Bold', alignment=TA_CENTER)
+STATEMENT_STYLE = ParagraphStyle('Statement', fontSize=14, alignment=TA_CENTER)
+PAGE_NUM_STYLE = ParagraphStyle('PageNum', fontSize=9, alignment=TA_CENTER)
+
+SUMMARY_TABLE_STYLE = TableStyle([
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
+
+TRANS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1F4E79')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F5F5')]),
+])
+
 def generate_transactions(start_date, num_days=30):
     """Generate random transactions for a statement period."""
     transactions = []
@@ -51,23 +75,26 @@ def generate_transactions(start_date, num_days=30):
         'debit': [5, 10, 15, 20, 25, 50, 75, 100, 150, 200, 250]
     }
     
+    # Draw every day's random values up front in a few batched calls
+    # 60% chance of transaction each day, 20% chance of credit, 80% debit
+    has_transaction = random.choices((True, False), weights=(0.6, 0.4), k=num_days)
+    trans_types = random.choices(('credit', 'debit'), weights=(0.2, 0.8), k=num_days)
+    picked_amounts = {t: random.choices(amounts[t], k=num_days) for t in amounts}
+    picked_merchants = {t: random.choices(merchants[t], k=num_days) for t in merchants}
+    
     current_date = start_date
-    for _ in range(num_days):
-        # 60% chance of transaction each day
-        if random.random() < 0.6:
-            # 20% chance of credit, 80% debit
-            if random.random() < 0.2:
-                trans_type = 'credit'
-                amount = random.choice(amounts['credit'])
+    for day in range(num_days):
+        if has_transaction[day]:
+            trans_type = trans_types[day]
+            amount = picked_amounts[trans_type][day]
+            if trans_type == 'credit':
                 balance += amount
             else:
-                trans_type = 'debit'
-                amount = random.choice(amounts['debit'])
                 balance -= amount
             
             transactions.append({
                 'date': current_date,
-                'description': random.choice(merchants[trans_type]),
+                'description': picked_merchants[trans_type][day],
                 'amount': amount if trans_type == 'credit' else -amount,
                 'balance': balance,
                 'type': trans_type
@@ -93,12 +120,11 @@ def create_statement_pdf(bank_name, account_number, output_path, num_days=30):
     
     # Create PDF
     doc = SimpleDocTemplate(output_path, pagesize=letter)
-    styles = getSampleStyleSheet()
     story = []
     
     # Bank Header
-    story.append(Paragraph(bank_name, ParagraphStyle('BankName', fontSize=20, fontName='Helvetica-Bold', alignment=TA_CENTER)))
-    story.append(Paragraph("Account Statement", ParagraphStyle('Statement', fontSize=14, alignment=TA_CENTER)))
+    story.append(Paragraph(bank_name, BANK_NAME_STYLE))
+    story.append(Paragraph("Account Statement", STATEMENT_STYLE))
     story.append(Spacer(1, 20))
     
     # Account Info
@@ -109,11 +135,11 @@ def create_statement_pdf(bank_name, account_number, output_path, num_days=30):
     <b>Statement Period:</b> {start_date.strftime('%B %d, %Y')} - {end_date.strftime('%B %d, %Y')}<br/>
     <b>Address:</b> 123 Main Street, New York, NY 10001
     """
-    story.append(Paragraph(account_info, styles['Normal']))
+    story.append(Paragraph(account_info, STYLES['Normal']))
     story.append(Spacer(1, 20))
     
     # Summary
-    story.append(Paragraph("<b>Account Summary</b>", styles['Heading2']))
+    story.append(Paragraph("<b>Account Summary</b>", STYLES['Heading2']))
     summary_data = [
         ['Opening Balance', f'${opening_balance:,.2f}'],
         ['Total Credits', f'${total_credits:,.2f}'],
@@ -121,15 +147,12 @@ def create_statement_pdf(bank_name, account_number, output_path, num_days=30):
         ['Closing Balance', f'${closing_balance:,.2f}'],
     ]
     summary_table = Table(summary_data, colWidths=[4*inch, 2*inch])
-    summary_table.setStyle(TableStyle([
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
+    summary_table.setStyle(SUMMARY_TABLE_STYLE)
     story.append(summary_table)
     story.append(Spacer(1, 20))
     
     # Transactions
-    story.append(Paragraph("<b>Transaction Details</b>", styles['Heading2']))
+    story.append(Paragraph("<b>Transaction Details</b>", STYLES['Heading2']))
     
     trans_header = ['Date', 'Description', 'Amount', 'Balance']
     trans_data = [trans_header]
@@ -144,23 +167,12 @@ def create_statement_pdf(bank_name, account_number, output_path, num_days=30):
         ])
     
     trans_table = Table(trans_data, colWidths=[1.2*inch, 3*inch, 1*inch, 1*inch])
-    trans_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1F4E79')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F5F5')]),
-    ]))
+    trans_table.setStyle(TRANS_TABLE_STYLE)
     story.append(trans_table)
     
     # Page number
     story.append(Spacer(1, 30))
-    story.append(Paragraph("Page 1 of 1", ParagraphStyle('PageNum', fontSize=9, alignment=TA_CENTER)))
+    story.append(Paragraph("Page 1 of 1", PAGE_NUM_STYLE))
     
     doc.build(story)
     
@@ -2,44 +2,93 @@
 """
 PDF Decryption Utility for password-protected bank statements.
 Usage: python3 scripts/decrypt_pdf.py <input_pdf_base64> <password>
+       python3 scripts/decrypt_pdf.py --auto [password]
+       python3 scripts/decrypt_pdf.py --worker
 Output: JSON with decrypted PDF base64 or error message
 """
 
 import sys
-import json
 import base64
+import binascii
+import io
 import tempfile
-import os
+from typing import TYPE_CHECKING
 
-try:
-    from pypdf import PdfReader, PdfWriter
-except ImportError:
-    print(json.dumps({"success": False, "error": "pypdf not installed. Run: pip install pypdf"}))
-    sys.exit(1)
+from _stdio import SPOOL_MAX_SIZE, read_base64_stream, serve_frames, write_json
 
-def decrypt_pdf(input_base64: str, password: str) -> dict:
+# pypdf is imported where it is used, so the input checks in __main__ run
+# without paying for it
+if TYPE_CHECKING:
+    from pypdf import PdfReader
+
+# The last trailer dictionary sits within this many bytes of the end of the file
+TRAILER_SCAN_SIZE = 8192
+
+def open_pdf_input(pdf_input) -> io.IOBase:
+    """Return a binary file for a base64 string, or pass an already decoded file through."""
+    if isinstance(pdf_input, str):
+        return io.BytesIO(base64.b64decode(pdf_input))
+    return pdf_input
+
+def page_count(reader: "PdfReader") -> int:
+    """Read the page count from the /Pages root instead of walking the whole page tree."""
+    try:
+        return int(reader.trailer["/Root"]["/Pages"]["/Count"])
+    except Exception:
+        # Malformed catalog: let pypdf count the pages itself
+        return len(reader.pages)
+
+def trailer_is_encrypted(pdf_file: io.IOBase):
+    """
+    Look for /Encrypt in the last trailer dictionary with a scan of the file's tail.
+    Returns None when there is no classic trailer to read (PDFs using
+    cross-reference streams), in which case only a full parse can tell.
+    """
+    pdf_file.seek(0, io.SEEK_END)
+    pdf_file.seek(max(0, pdf_file.tell() - TRAILER_SCAN_SIZE))
+    tail = pdf_file.read()
+    pdf_file.seek(0)
+
+    start = tail.rfind(b"trailer")
+    if start < 0 or b"startxref" not in tail[start:]:
+        return None
+    return b"/Encrypt" in tail[start:]
+
+def decrypt_pdf(pdf_input, password: str, encode_output: bool = True,
+                only_if_encrypted: bool = False) -> dict:
     """
     Decrypt a password-protected PDF.
     
     Args:
-        input_base64: Base64 encoded PDF content
+        pdf_input: Base64 encoded PDF content, or a binary file with the decoded PDF
         password: PDF password
+        encode_output: Return the decrypted PDF as base64 text; when False the
+            "decrypted_base64" value is the decrypted file, for write_json to
+            encode while it streams the result out
+        only_if_encrypted: For an unencrypted PDF, return the page count without
+            a "decrypted_base64" copy
     
     Returns:
         dict with success status and decrypted PDF base64 or error message
     """
+    reader = None
     try:
-        # Decode base64 to bytes
-        pdf_bytes = base64.b64decode(input_base64)
-        
-        # Create a temporary file for the input
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as input_file:
-            input_file.write(pdf_bytes)
-            input_path = input_file.name
+        from pypdf import PdfReader, PdfWriter
+
+        # Decode base64 to bytes (unless the caller already did)
+        pdf_file = open_pdf_input(pdf_input)
         
         try:
-            # Try to read the PDF
-            reader = PdfReader(input_path)
+            # Try to read the PDF straight from memory
+            reader = PdfReader(pdf_file)
+            
+            # Nothing to decrypt: answer like check_if_encrypted instead of cloning
+            if only_if_encrypted and not reader.is_encrypted:
+                return {
+                    "success": True,
+                    "is_encrypted": False,
+                    "num_pages": page_count(reader)
+                }
             
             # Check if PDF is encrypted
             if reader.is_encrypted:
@@ -51,38 +100,26 @@ def decrypt_pdf(input_base64: str, password: str) -> dict:
                         "is_encrypted": True
                     }
             
-            # Create a new PDF without encryption
-            writer = PdfWriter()
-            
-            # Copy all pages
-            for page in reader.pages:
-                writer.add_page(page)
-            
-            # Write to bytes
-            output_bytes = bytes()
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as output_file:
-                output_path = output_file.name
-            
-            with open(output_path, 'wb') as f:
-                writer.write(f)
-            
-            # Read the decrypted PDF
-            with open(output_path, 'rb') as f:
-                decrypted_bytes = f.read()
-            
-            # Encode to base64
-            decrypted_base64 = base64.b64encode(decrypted_bytes).decode('utf-8')
+            # Create a new PDF without encryption, cloning the whole document
+            # tree in one go instead of copying page by page
+            writer = PdfWriter(clone_from=reader)
             
-            # Clean up temp files
-            os.unlink(input_path)
-            os.unlink(output_path)
+            # Write to bytes (spilling to disk only for very large PDFs)
+            output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+            writer.write(output)
             
-            return {
+            result = {
                 "success": True,
-                "decrypted_base64": decrypted_base64,
                 "is_encrypted": reader.is_encrypted,
-                "num_pages": len(reader.pages)
+                "num_pages": page_count(reader)
             }
+            if encode_output:
+                # Encode to base64
+                output.seek(0)
+                result["decrypted_base64"] = base64.b64encode(output.read()).decode('utf-8')
+            else:
+                result["decrypted_base64"] = output
+            return result
             
         except Exception as e:
             # Check if it's a password issue
@@ -96,40 +133,40 @@ def decrypt_pdf(input_base64: str, password: str) -> dict:
             raise
             
     except Exception as e:
+        # A failure after opening (e.g. while cloning) must not pass an encrypted file off as plain
         return {
             "success": False,
             "error": f"Failed to process PDF: {str(e)}",
-            "is_encrypted": False
+            "is_encrypted": reader is not None and reader.is_encrypted
         }
 
-def check_if_encrypted(input_base64: str) -> dict:
+def check_if_encrypted(pdf_input) -> dict:
     """
     Check if a PDF is encrypted without trying to decrypt.
     
     Args:
-        input_base64: Base64 encoded PDF content
+        pdf_input: Base64 encoded PDF content, or a binary file with the decoded PDF
     
     Returns:
         dict with is_encrypted status
     """
     try:
-        pdf_bytes = base64.b64decode(input_base64)
-        
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as input_file:
-            input_file.write(pdf_bytes)
-            input_path = input_file.name
+        pdf_file = open_pdf_input(pdf_input)
+
+        # Encrypted PDFs report no page count, so the trailer alone answers
+        if trailer_is_encrypted(pdf_file):
+            return {"success": True, "is_encrypted": True, "num_pages": None}
+
+        from pypdf import PdfReader
+
+        reader = PdfReader(pdf_file)
+        is_encrypted = reader.is_encrypted
         
-        try:
-            reader = PdfReader(input_path)
-            is_encrypted = reader.is_encrypted
-            
-            return {
-                "success": True,
-                "is_encrypted": is_encrypted,
-                "num_pages": len(reader.pages) if not is_encrypted else None
-            }
-        finally:
-            os.unlink(input_path)
+        return {
+            "success": True,
+            "is_encrypted": is_encrypted,
+            "num_pages": page_count(reader) if not is_encrypted else None
+        }
             
     except Exception as e:
         return {
@@ -138,28 +175,89 @@ def check_if_encrypted(input_base64: str) -> dict:
             "is_encrypted": False
         }
 
-if __name__ == "__main__":
-    # Read base64 from stdin (avoids ENAMETOOLONG on large PDFs)
-    input_base64 = sys.stdin.read().strip()
+def check_and_decrypt(pdf_input, password: str = None, encode_output: bool = True) -> dict:
+    """
+    Check whether a PDF is encrypted and, if it is and a password is given,
+    decrypt it from the same PdfReader -- one call instead of a --check run
+    followed by a decrypt run.
+    
+    Args:
+        pdf_input: Base64 encoded PDF content, or a binary file with the decoded PDF
+        password: PDF password, or None to only check
+        encode_output: See decrypt_pdf
+    
+    Returns:
+        dict with is_encrypted and num_pages, plus decrypted PDF base64 when
+        an encrypted PDF was decrypted, or an error message
+    """
+    if not password:
+        return check_if_encrypted(pdf_input)
+    return decrypt_pdf(pdf_input, password, encode_output, only_if_encrypted=True)
 
-    if not input_base64:
-        print(json.dumps({"success": False, "error": "No input provided. Pipe base64 PDF data via stdin."}))
+def handle_request(request: dict) -> dict:
+    """
+    Handle one --worker request:
+    {"pdf": <base64>, "password": <str>, "check": <bool>, "auto": <bool>}.
+    Without a password (or with "check") this only reports whether the PDF is
+    encrypted; "auto" decrypts only PDFs that are encrypted (see check_and_decrypt).
+    """
+    pdf_base64 = request.get("pdf")
+    if not pdf_base64:
+        return {"success": False, "error": "No input provided. Send base64 PDF data as \"pdf\"."}
+
+    password = request.get("password")
+    if request.get("auto"):
+        return check_and_decrypt(pdf_base64, password)
+    if request.get("check") or not password:
+        return check_if_encrypted(pdf_base64)
+    return decrypt_pdf(pdf_base64, password)
+
+def require_pypdf() -> None:
+    """Exit with a JSON error if pypdf is missing."""
+    try:
+        import pypdf  # noqa: F401
+    except ImportError:
+        write_json({"success": False, "error": "pypdf not installed. Run: pip install pypdf"})
         sys.exit(1)
 
+if __name__ == "__main__":
+    # Persistent worker: one framed request/response per PDF until stdin closes
+    if '--worker' in sys.argv:
+        require_pypdf()
+        serve_frames(handle_request)
+        sys.exit(0)
+
     # Check for flags in argv
     check_mode = '--check' in sys.argv
+    auto_mode = '--auto' in sys.argv
     password = None
     for arg in sys.argv[1:]:
-        if arg != '--check':
+        if arg not in ('--check', '--auto'):
             password = arg
             break
 
-    if check_mode:
-        result = check_if_encrypted(input_base64)
+    # Read base64 from stdin (avoids ENAMETOOLONG on large PDFs), decoding it as it streams in
+    try:
+        pdf_file = read_base64_stream(sys.stdin.buffer)
+    except binascii.Error as e:
+        error = str(e) if check_mode or not password else f"Failed to process PDF: {e}"
+        write_json({"success": False, "error": error, "is_encrypted": False})
+        sys.exit(0)
+
+    if pdf_file is None:
+        write_json({"success": False, "error": "No input provided. Pipe base64 PDF data via stdin."})
+        sys.exit(1)
+
+    require_pypdf()
+
+    if auto_mode:
+        result = check_and_decrypt(pdf_file, password, encode_output=False)
+    elif check_mode:
+        result = check_if_encrypted(pdf_file)
     elif password:
-        result = decrypt_pdf(input_base64, password)
+        result = decrypt_pdf(pdf_file, password, encode_output=False)
     else:
-        result = check_if_encrypted(input_base64)
+        result = check_if_encrypted(pdf_file)
 
-    print(json.dumps(result))
+    write_json(result)
 
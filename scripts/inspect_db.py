@@ -2,50 +2,72 @@ import sqlite3
 import json
 import os
 
+try:
+    from orjson import loads as _jloads
+except ImportError:
+    _jloads = json.JSONDecoder().decode
+
 db_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'db', 'custom.db')
 conn = sqlite3.connect(db_path)
-conn.row_factory = sqlite3.Row
+
+
+def estimate_rows(table):
+    """
+    Row count estimate without a COUNT(*) full scan: the ANALYZE statistics
+    in sqlite_stat1 when present, otherwise the largest rowid (an upper bound
+    that stays high after deletes).
+    """
+    try:
+        row = conn.execute("SELECT stat FROM sqlite_stat1 WHERE tbl=?", (table,)).fetchone()
+    except sqlite3.OperationalError:
+        row = None  # ANALYZE never run
+    if row:
+        return int(row[0].split()[0])
+    return conn.execute(f"SELECT MAX(_rowid_) FROM [{table}]").fetchone()[0] or 0
+
 
 # List all tables
 tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
-print("=== DATABASE TABLES ===")
+print("=== DATABASE TABLES (estimated row counts) ===")
 for t in tables:
-    count = conn.execute(f"SELECT COUNT(*) FROM [{t[0]}]").fetchone()[0]
-    print(f"  {t[0]}: {count} rows")
+    print(f"  {t[0]}: ~{estimate_rows(t[0])} rows")
 
 # Show templates
 print("\n=== SAVED BANK TEMPLATES ===")
-templates = conn.execute("SELECT * FROM BankTemplate").fetchall()
+templates = conn.execute(
+    "SELECT id, bankName, accountType, patterns, columnMapping,"
+    " timesUsed, successRate, createdAt, updatedAt FROM BankTemplate"
+).fetchall()
 if not templates:
     print("  (no templates saved yet)")
 else:
-    for row in templates:
-        d = dict(row)
-        print(f"\n--- Template: {d['bankName']} ---")
-        print(f"  ID:          {d['id']}")
-        print(f"  Bank Name:   {d['bankName']}")
-        print(f"  Account Type:{d.get('accountType', 'N/A')}")
-        print(f"  Times Used:  {d['timesUsed']}")
-        print(f"  Success Rate:{d['successRate']}")
-        print(f"  Created:     {d['createdAt']}")
-        print(f"  Updated:     {d['updatedAt']}")
+    for (template_id, bank_name, account_type, patterns_json, mapping_json,
+         times_used, success_rate, created_at, updated_at) in templates:
+        print(f"\n--- Template: {bank_name} ---")
+        print(f"  ID:          {template_id}")
+        print(f"  Bank Name:   {bank_name}")
+        print(f"  Account Type:{account_type}")
+        print(f"  Times Used:  {times_used}")
+        print(f"  Success Rate:{success_rate}")
+        print(f"  Created:     {created_at}")
+        print(f"  Updated:     {updated_at}")
         
         # Pretty-print patterns
         try:
-            patterns = json.loads(d['patterns'])
+            patterns = _jloads(patterns_json)
             print(f"  Patterns:")
             for k, v in patterns.items():
                 print(f"    {k}: {v}")
         except:
-            print(f"  Patterns (raw): {d['patterns']}")
+            print(f"  Patterns (raw): {patterns_json}")
         
         # Pretty-print column mapping
         try:
-            mapping = json.loads(d['columnMapping'])
+            mapping = _jloads(mapping_json)
             print(f"  Column Mapping:")
             for k, v in mapping.items():
                 print(f"    {k}: {v}")
         except:
-            print(f"  Column Mapping (raw): {d['columnMapping']}")
+            print(f"  Column Mapping (raw): {mapping_json}")
 
 conn.close()
@@ -5,74 +5,68 @@ Uses pdfplumber to extract raw text and table data from a PDF.
 No AI/LLM involved — purely structural extraction.
 
 Usage: echo <base64_pdf> | python scripts/parse_pdf.py
+       python scripts/parse_pdf.py --worker
 Output: JSON with extracted text and tables per page.
 """
 
 import sys
-import json
 import base64
-import tempfile
+import binascii
+import io
 import os
+from concurrent.futures import ProcessPoolExecutor
 
-try:
-    import pdfplumber
-except ImportError:
-    print(json.dumps({
-        "success": False,
-        "error": "pdfplumber not installed. Run: pip install pdfplumber"
-    }))
-    sys.exit(1)
+from _stdio import read_base64_stream, serve_frames, write_json
+
+# pdfplumber (and pdfminer under it) is imported where it is used, so the
+# input checks in __main__ run without paying for it
+
+
+# PDFs with at least this many pages are split across a process pool
+PARALLEL_PAGE_THRESHOLD = 8
 
+# The PDF opened once per pool worker (see _init_worker)
+_worker_pdf = None
 
-def extract_pdf_content(input_base64: str) -> dict:
+
+def extract_pdf_content(pdf_input) -> dict:
     """
     Extract text and tables from a PDF.
+    pdf_input is base64 encoded PDF content, or a binary file with the decoded PDF.
     """
     try:
-        pdf_bytes = base64.b64decode(input_base64)
-
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-            tmp.write(pdf_bytes)
-            tmp_path = tmp.name
-
-        try:
-            with pdfplumber.open(tmp_path) as pdf:
-                full_text = ""
-                pages = []
-
-                for page_num, page in enumerate(pdf.pages):
-                    page_text = page.extract_text() or ""
-                    full_text += page_text + "\n"
-
-                    # Extract tables from this page
-                    raw_tables = page.extract_tables() or []
-                    tables = []
-                    for table in raw_tables:
-                        if table and len(table) > 0:
-                            cleaned = []
-                            for row in table:
-                                cleaned_row = [
-                                    (str(cell).strip() if cell else "")
-                                    for cell in row
-                                ]
-                                cleaned.append(cleaned_row)
-                            tables.append(cleaned)
-
-                    pages.append({
-                        "pageNumber": page_num + 1,
-                        "text": page_text,
-                        "tables": tables,
-                    })
-
-                return {
-                    "success": True,
-                    "fullText": full_text.strip(),
-                    "pages": pages,
-                    "pageCount": len(pdf.pages),
-                }
-
-        finally:
-            os.unlink(tmp_path)
+        import pdfplumber
+
+        if isinstance(pdf_input, str):
+            pdf_input = io.BytesIO(base64.b64decode(pdf_input))
+
+        with pdfplumber.open(pdf_input) as pdf:
+            full_text = ""
+            pages = []
+
+            page_count = len(pdf.pages)
+            # A pool only pays for its process startup when there is more than one core
+            if page_count >= PARALLEL_PAGE_THRESHOLD and (os.cpu_count() or 1) > 1:
+                pdf_input.seek(0)
+                results = _extract_pages_parallel(pdf_input.read(), page_count)
+            else:
+                results = map(extract_page, pdf.pages)
+
+            for page_num, (page_text, tables) in enumerate(results):
+                full_text += page_text + "\n"
+
+                pages.append({
+                    "pageNumber": page_num + 1,
+                    "text": page_text,
+                    "tables": tables,
+                })
+
+            return {
+                "success": True,
+                "fullText": full_text.strip(),
+                "pages": pages,
+                "pageCount": page_count,
+            }
 
     except Exception as e:
         return {
@@ -81,16 +75,96 @@ def extract_pdf_content(input_base64: str) -> dict:
         }
 
 
+def extract_page(page) -> tuple:
+    """Extract the text and cleaned tables of a single page."""
+    page_text = page.extract_text() or ""
+
+    # Extract tables from this page. The default table settings find cells
+    # from ruling lines, so a page without any (cover pages, terms and
+    # conditions) cannot yield a table and skips the edge detection
+    if page.lines or page.rects or page.curves:
+        raw_tables = page.extract_tables() or []
+    else:
+        raw_tables = []
+    tables = [
+        [[(str(cell).strip() if cell else "") for cell in row] for row in table]
+        for table in raw_tables
+        if table
+    ]
+
+    return page_text, tables
+
+
+def _extract_pages_parallel(pdf_bytes: bytes, page_count: int) -> list:
+    """
+    Extract every page in a process pool, returning results in page order.
+    Each worker receives the PDF once and handles a contiguous run of pages.
+    """
+    workers = min(os.cpu_count() or 1, page_count)
+    chunksize = -(-page_count // workers)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(pdf_bytes,),
+    ) as executor:
+        return list(executor.map(_extract_page_at, range(page_count), chunksize=chunksize))
+
+
+def _init_worker(pdf_bytes: bytes) -> None:
+    """Open the PDF once per worker process."""
+    import pdfplumber
+
+    global _worker_pdf
+    _worker_pdf = pdfplumber.open(io.BytesIO(pdf_bytes))
+
+
+def _extract_page_at(page_index: int) -> tuple:
+    """Extract one page of the worker's PDF (runs in a worker process)."""
+    return extract_page(_worker_pdf.pages[page_index])
+
+
+def handle_request(request: dict) -> dict:
+    """Handle one --worker request: {"pdf": <base64>}."""
+    pdf_base64 = request.get("pdf")
+    if not pdf_base64:
+        return {"success": False, "error": "No input provided. Send base64 PDF data as \"pdf\"."}
+    return extract_pdf_content(pdf_base64)
+
+
+def require_pdfplumber() -> None:
+    """Exit with a JSON error if pdfplumber is missing."""
+    try:
+        import pdfplumber  # noqa: F401
+    except ImportError:
+        write_json({
+            "success": False,
+            "error": "pdfplumber not installed. Run: pip install pdfplumber"
+        })
+        sys.exit(1)
+
+
 if __name__ == "__main__":
-    # Read base64 input from stdin (avoids ENAMETOOLONG on large PDFs)
-    input_base64 = sys.stdin.read().strip()
+    # Persistent worker: one framed request/response per PDF until stdin closes
+    if "--worker" in sys.argv:
+        require_pdfplumber()
+        serve_frames(handle_request)
+        sys.exit(0)
 
-    if not input_base64:
-        print(json.dumps({
+    # Read base64 input from stdin (avoids ENAMETOOLONG on large PDFs), decoding it as it streams in
+    try:
+        pdf_file = read_base64_stream(sys.stdin.buffer)
+    except binascii.Error as e:
+        write_json({"success": False, "error": f"Failed to extract PDF content: {e}"})
+        sys.exit(0)
+
+    if pdf_file is None:
+        write_json({
             "success": False,
             "error": "No input provided. Pipe base64 PDF data via stdin."
-        }))
+        })
         sys.exit(1)
 
-    result = extract_pdf_content(input_base64)
-    print(json.dumps(result))
+    require_pdfplumber()
+
+    result = extract_pdf_content(pdf_file)
+    write_json(result)
@@ -14,26 +14,32 @@ for path in [db_path, prisma_db_path]:
         print(f"  Skipped (not found): {path}")
         continue
     
-    conn = sqlite3.connect(path)
+    # Autocommit mode, so the purge below is one explicit transaction
+    conn = sqlite3.connect(path, isolation_level=None)
     cursor = conn.cursor()
     
     # Get tables
     tables = [r[0] for r in cursor.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()]
     
     # Delete user data tables (NOT BankTemplate)
+    # (all deletes commit together; rowcount saves a COUNT(*) scan per table)
     user_tables = ['GroupedStatement', 'StatementGroup', 'Transaction', 'BankStatement']
-    for table in user_tables:
-        if table in tables:
-            count = cursor.execute(f"SELECT COUNT(*) FROM [{table}]").fetchone()[0]
-            cursor.execute(f"DELETE FROM [{table}]")
-            print(f"  Purged {table}: {count} rows deleted")
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        for table in user_tables:
+            if table in tables:
+                count = cursor.execute(f"DELETE FROM [{table}]").rowcount
+                print(f"  Purged {table}: {count} rows deleted")
+        cursor.execute("COMMIT")
+    except Exception:
+        cursor.execute("ROLLBACK")
+        raise
     
     # Show what's preserved
     if 'BankTemplate' in tables:
         count = cursor.execute("SELECT COUNT(*) FROM BankTemplate").fetchone()[0]
         print(f"  Preserved BankTemplate: {count} templates kept")
     
-    conn.commit()
     conn.close()
     print(f"  Done: {path}")
 
@@ -1,6 +1,4 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { spawn } from 'child_process';
-import path from 'path';
 import {
   extractBankStatement,
   processBulkStatements,
@@ -8,75 +6,24 @@ import {
   clearAllStatements,
   getGroupedStatements,
 } from '@/lib/extraction';
+import { runPythonWorker } from '@/lib/python-worker';
 
-/**
- * Run a Python script with base64 data piped via stdin.
- */
-function runPythonScript(
-  scriptPath: string,
-  args: string[],
-  stdinData: string
-): Promise<string> {
-  return new Promise((resolve, reject) => {
-    const child = spawn('python', [scriptPath, ...args], {
-      stdio: ['pipe', 'pipe', 'pipe'],
-    });
-
-    let stdout = '';
-    let stderr = '';
-
-    child.stdout.on('data', (data: Buffer) => { stdout += data.toString(); });
-    child.stderr.on('data', (data: Buffer) => { stderr += data.toString(); });
-
-    child.on('close', (code: number) => {
-      if (code !== 0 && !stdout) {
-        reject(new Error(stderr || `Script exited with code ${code}`));
-        return;
-      }
-      resolve(stdout.trim());
-    });
-
-    child.on('error', (err: Error) => reject(err));
-
-    child.stdin.write(stdinData);
-    child.stdin.end();
-  });
-}
-
-/**
- * Decrypt a password-protected PDF using Python script
- */
-async function decryptPDF(pdfBase64: string, password: string): Promise<{
+/** Output of decrypt_pdf.py */
+interface DecryptResult {
   success: boolean;
+  is_encrypted: boolean;
+  num_pages?: number;
   decrypted_base64?: string;
   error?: string;
-  is_encrypted?: boolean;
-}> {
-  try {
-    const scriptPath = path.join(process.cwd(), 'scripts', 'decrypt_pdf.py');
-    const output = await runPythonScript(scriptPath, [password], pdfBase64);
-    return JSON.parse(output);
-  } catch (error) {
-    return {
-      success: false,
-      error: error instanceof Error ? error.message : 'Failed to decrypt PDF'
-    };
-  }
 }
 
 /**
- * Check if a PDF is encrypted
+ * Check if a PDF is encrypted and, when it is and a password is given, decrypt it.
+ * Both happen in one request to the decrypt_pdf.py worker, which parses the PDF once.
  */
-async function checkEncryption(pdfBase64: string): Promise<{
-  success: boolean;
-  is_encrypted: boolean;
-  num_pages?: number;
-  error?: string;
-}> {
+async function checkAndDecrypt(pdfBase64: string, password?: string): Promise<DecryptResult> {
   try {
-    const scriptPath = path.join(process.cwd(), 'scripts', 'decrypt_pdf.py');
-    const output = await runPythonScript(scriptPath, ['--check'], pdfBase64);
-    return JSON.parse(output);
+    return await runPythonWorker<DecryptResult>('decrypt_pdf.py', { pdf: pdfBase64, password, auto: true });
   } catch (error) {
     return {
       success: false,
@@ -133,10 +80,10 @@ export async function POST(request: NextRequest) {
     for (const file of files) {
       const { pdfBase64, fileName } = file;
 
-      // Check if PDF is encrypted
-      const encryptionCheck = await checkEncryption(pdfBase64);
+      // Check if PDF is encrypted (and decrypt it in the same run if we have a password)
+      const decryptResult = await checkAndDecrypt(pdfBase64, password);
 
-      if (encryptionCheck.success && encryptionCheck.is_encrypted) {
+      if (decryptResult.is_encrypted) {
         // PDF is encrypted - need password
         if (!password) {
           return NextResponse.json({
@@ -147,9 +94,6 @@ export async function POST(request: NextRequest) {
           }, { status: 400 });
         }
 
-        // Try to decrypt
-        const decryptResult = await decryptPDF(pdfBase64, password);
-
         if (!decryptResult.success) {
           return NextResponse.json({
             success: false,
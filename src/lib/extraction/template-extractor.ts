@@ -1,7 +1,6 @@
 // Template-based extraction: parses PDF using saved patterns (no LLM)
 
-import { spawn } from 'child_process';
-import path from 'path';
+import { runPythonWorker } from '../python-worker';
 import {
     ExtractedStatement,
     ExtractedTransaction,
@@ -25,49 +24,13 @@ interface ParsedPDF {
 }
 
 /**
- * Call the Python script to extract raw text + tables from a PDF.
- * Uses stdin to pass base64 data (avoids ENAMETOOLONG).
+ * Extract raw text + tables from a PDF with the kept-alive parse_pdf.py worker.
  */
 export async function parsePDFContent(pdfBase64: string): Promise<ParsedPDF | null> {
     try {
-        const scriptPath = path.join(process.cwd(), 'scripts', 'parse_pdf.py');
-
-        return await new Promise<ParsedPDF | null>((resolve) => {
-            const child = spawn('python', [scriptPath], {
-                stdio: ['pipe', 'pipe', 'pipe'],
-            });
-
-            let stdout = '';
-            let stderr = '';
-
-            child.stdout.on('data', (data: Buffer) => { stdout += data.toString(); });
-            child.stderr.on('data', (data: Buffer) => { stderr += data.toString(); });
-
-            child.on('close', (code: number) => {
-                if (code !== 0 || (stderr && !stdout)) {
-                    console.error('parse_pdf.py failed:', stderr || `exit code ${code}`);
-                    resolve(null);
-                    return;
-                }
-                try {
-                    resolve(JSON.parse(stdout.trim()) as ParsedPDF);
-                } catch {
-                    console.error('parse_pdf.py invalid JSON:', stdout.substring(0, 200));
-                    resolve(null);
-                }
-            });
-
-            child.on('error', (err: Error) => {
-                console.error('parsePDFContent spawn error:', err);
-                resolve(null);
-            });
-
-            // Write base64 data to stdin and close
-            child.stdin.write(pdfBase64);
-            child.stdin.end();
-        });
+        return await runPythonWorker<ParsedPDF>('parse_pdf.py', { pdf: pdfBase64 });
     } catch (error) {
-        console.error('parsePDFContent error:', error);
+        console.error('parse_pdf.py failed:', error);
         return null;
     }
 }
@@ -0,0 +1,128 @@
+// Long-lived Python workers for the PDF scripts in scripts/.
+// Each script runs with --worker and answers length-prefixed JSON frames
+// (4-byte big-endian length, then the UTF-8 body), so interpreter startup and
+// library imports are paid once per process instead of once per PDF.
+
+import { spawn, ChildProcessWithoutNullStreams } from 'child_process';
+import path from 'path';
+
+interface PendingRequest {
+  resolve: (value: unknown) => void;
+  reject: (err: Error) => void;
+}
+
+class PythonWorker {
+  private child: ChildProcessWithoutNullStreams | null = null;
+  // Requests are answered in the order they were sent
+  private pending: PendingRequest[] = [];
+  private chunks: Buffer[] = [];
+  private received = 0;
+  private frameSize = -1;
+  private stderr = '';
+
+  constructor(private readonly script: string) {}
+
+  request<T>(payload: Record<string, unknown>): Promise<T> {
+    const child = this.child ?? this.start();
+    return new Promise<T>((resolve, reject) => {
+      this.pending.push({ resolve: resolve as (value: unknown) => void, reject });
+      const body = Buffer.from(JSON.stringify(payload), 'utf8');
+      const header = Buffer.alloc(4);
+      header.writeUInt32BE(body.length);
+      child.stdin.write(header);
+      child.stdin.write(body);
+    });
+  }
+
+  private start(): ChildProcessWithoutNullStreams {
+    const scriptPath = path.join(process.cwd(), 'scripts', this.script);
+    const child = spawn('python', [scriptPath, '--worker'], {
+      stdio: ['pipe', 'pipe', 'pipe'],
+    });
+    this.child = child;
+    this.chunks = [];
+    this.received = 0;
+    this.frameSize = -1;
+    this.stderr = '';
+
+    child.stdout.on('data', (data: Buffer) => this.onData(data));
+    // Keep only the tail of stderr, for the error message if the worker dies
+    child.stderr.on('data', (data: Buffer) => {
+      this.stderr = (this.stderr + data.toString()).slice(-4096);
+    });
+    // A write to a worker that already exited fails here; 'close' rejects the requests
+    child.stdin.on('error', () => {});
+    child.on('error', (err: Error) => this.fail(child, err));
+    child.on('close', (code: number | null) => {
+      this.fail(child, new Error(this.stderr || `${this.script} exited with code ${code}`));
+    });
+    return child;
+  }
+
+  private onData(data: Buffer) {
+    this.chunks.push(data);
+    this.received += data.length;
+
+    while (true) {
+      if (this.frameSize < 0) {
+        if (this.received < 4) return;
+        this.frameSize = this.merge().readUInt32BE(0);
+      }
+      if (this.received < 4 + this.frameSize) return;
+
+      // Join the chunks once per frame rather than on every 'data' event
+      const buffer = this.merge();
+      const body = buffer.subarray(4, 4 + this.frameSize).toString('utf8');
+      const rest = buffer.subarray(4 + this.frameSize);
+      this.chunks = rest.length ? [rest] : [];
+      this.received = rest.length;
+      this.frameSize = -1;
+
+      const request = this.pending.shift();
+      if (!request) continue;
+      try {
+        request.resolve(JSON.parse(body));
+      } catch (err) {
+        request.reject(err instanceof Error ? err : new Error(String(err)));
+      }
+    }
+  }
+
+  private merge(): Buffer {
+    if (this.chunks.length > 1) {
+      this.chunks = [Buffer.concat(this.chunks, this.received)];
+    }
+    return this.chunks[0];
+  }
+
+  private fail(child: ChildProcessWithoutNullStreams, err: Error) {
+    // Ignore events from a worker that has already been replaced
+    if (this.child !== child) return;
+    this.child = null;
+    for (const request of this.pending.splice(0)) {
+      request.reject(err);
+    }
+  }
+}
+
+// Reuse the workers across hot reloads in development, like the Prisma client in db.ts
+const globalForWorkers = globalThis as unknown as {
+  pythonWorkers: Map<string, PythonWorker> | undefined
+};
+
+const workers = globalForWorkers.pythonWorkers ?? new Map<string, PythonWorker>();
+
+if (process.env.NODE_ENV !== 'production') globalForWorkers.pythonWorkers = workers;
+
+/**
+ * Send one request to the kept-alive worker for a script in scripts/
+ * (started on first use, and restarted if it exits) and resolve with its reply.
+ */
+export function runPythonWorker<T>(script: string, request: Record<string, unknown>): Promise<T> {
+  let worker = workers.get(script);
+  if (!worker) {
+    worker = new PythonWorker(script);
+    workers.set(script, worker);
+  }
+  return worker.request<T>(request);
+}
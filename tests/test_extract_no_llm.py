@@ -0,0 +1,189 @@
+"""
+Tests for the transaction table rebuild and amount parsing in extract_no_llm.py.
+Run with: python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extract_no_llm import (
+    _find_transaction_table, _may_fill_metadata, extract_metadata, extract_tables, parse_amount,
+    parse_balance, parse_transaction_table,
+)
+
+# Column positions of a Date/Description/Amount/Balance table
+DATE_X, DESCRIPTION_X, AMOUNT_X, BALANCE_X = 84, 146, 251, 307
+TYPE_X = 230  # an extra column between Description and Amount
+
+
+def word(text, x0, top, height=10):
+    """A positioned word as pdfplumber's extract_words() returns it."""
+    return {"text": text, "x0": x0, "x1": x0 + 5 * len(text), "top": top, "bottom": top + height}
+
+
+def header(top=111):
+    return [word("Date", DATE_X, top), word("Description", DESCRIPTION_X, top),
+            word("Amount", AMOUNT_X, top), word("Balance", BALANCE_X, top)]
+
+
+def row(top, date, description, amount, balance):
+    words = [word(date, DATE_X, top), word(amount, AMOUNT_X, top), word(balance, BALANCE_X, top)]
+    if description:
+        words.append(word(description, DESCRIPTION_X, top))
+    return words
+
+
+class FindTransactionTableTest(unittest.TestCase):
+
+    def test_plain_rows(self):
+        words = header() + row(129, "01/05/2024", "PAYROLL", "$2,500.00", "$3,500.00") \
+            + row(147, "01/09/2024", "COFFEE", "-$4.50", "$3,495.50")
+        self.assertEqual(_find_transaction_table(words), [
+            ["Date", "Description", "Amount", "Balance"],
+            ["01/05/2024", "PAYROLL", "$2,500.00", "$3,500.00"],
+            ["01/09/2024", "COFFEE", "-$4.50", "$3,495.50"],
+        ])
+
+    def test_wrapped_description_with_date_on_second_line(self):
+        # Bottom-aligned cells: the first description line sits above the date
+        words = header() + row(129, "01/05/2024", "PAYROLL", "$2,500.00", "$3,500.00") \
+            + [word("AMAZON MARKETPLACE", DESCRIPTION_X, 147)] \
+            + row(159, "01/07/2024", "SEATTLE WA", "-$45.99", "$3,454.01") \
+            + row(177, "01/09/2024", "COFFEE", "-$4.50", "$3,449.51")
+        table = _find_transaction_table(words)
+        self.assertEqual(len(table), 4)
+        self.assertEqual(table[2], ["01/07/2024", "AMAZON MARKETPLACE\nSEATTLE WA", "-$45.99", "$3,454.01"])
+        self.assertEqual(table[3][1], "COFFEE")
+
+    def test_wrapped_description_with_date_on_first_line(self):
+        # Top-aligned cells: the continuation follows the date line
+        words = header() + row(129, "01/05/2024", "PAYROLL", "$2,500.00", "$3,500.00") \
+            + row(147, "01/07/2024", "AMAZON MARKETPLACE", "-$45.99", "$3,454.01") \
+            + [word("SEATTLE WA", DESCRIPTION_X, 159)] \
+            + row(177, "01/09/2024", "COFFEE", "-$4.50", "$3,449.51")
+        table = _find_transaction_table(words)
+        self.assertEqual([r[1] for r in table[1:]], ["PAYROLL", "AMAZON MARKETPLACE\nSEATTLE WA", "COFFEE"])
+
+    def test_wrapped_rows_are_all_parsed(self):
+        words = header() + row(129, "01/05/2024", "PAYROLL", "$2,500.00", "$3,500.00") \
+            + [word("AMAZON MARKETPLACE", DESCRIPTION_X, 147)] \
+            + row(159, "01/07/2024", "SEATTLE WA", "-$45.99", "$3,454.01") \
+            + row(177, "01/09/2024", "COFFEE", "-$4.50", "$3,449.51")
+        transactions = parse_transaction_table(_find_transaction_table(words))
+        self.assertEqual([t["date"] for t in transactions], ["2024-01-05", "2024-01-07", "2024-01-09"])
+
+    def test_trailing_text_in_date_column_ends_table(self):
+        words = header() + row(129, "01/05/2024", "PAYROLL", "$2,500.00", "$3,500.00") \
+            + row(147, "01/09/2024", "COFFEE", "-$4.50", "$3,495.50") \
+            + [word("Questions? Call 1-800-935-9935 anytime", DATE_X, 165)]
+        table = _find_transaction_table(words)
+        self.assertEqual([r[0] for r in table[1:]], ["01/05/2024", "01/09/2024"])
+        self.assertEqual(table[2][1], "COFFEE")
+
+    def test_trailing_text_across_columns_ends_table(self):
+        words = header() + row(129, "01/05/2024", "PAYROLL", "$2,500.00", "$3,500.00") \
+            + row(147, "01/09/2024", "COFFEE", "-$4.50", "$3,495.50") \
+            + [word("Questions?", 215, 165), word("1-800-935-9935", 288, 165)]
+        table = _find_transaction_table(words)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table[2], ["01/09/2024", "COFFEE", "-$4.50", "$3,495.50"])
+
+    def test_distant_text_in_description_column_ends_table(self):
+        words = header() + row(129, "01/05/2024", "PAYROLL", "$2,500.00", "$3,500.00") \
+            + row(147, "01/09/2024", "COFFEE", "-$4.50", "$3,495.50") \
+            + [word("Thank you for banking with us", DESCRIPTION_X, 200)]
+        table = _find_transaction_table(words)
+        self.assertEqual(table[2][1], "COFFEE")
+
+    def test_unplaceable_line_between_rows_falls_back(self):
+        words = header() + row(129, "01/05/2024", "PAYROLL", "$2,500.00", "$3,500.00") \
+            + [word("pending", AMOUNT_X, 147)] \
+            + row(165, "01/09/2024", "COFFEE", "-$4.50", "$3,495.50")
+        self.assertIsNone(_find_transaction_table(words))
+
+    def test_extra_header_column_falls_back(self):
+        words = header() + [word("Type", TYPE_X, 111)] \
+            + row(129, "01/07/2024", "AMAZON", "-$45.99", "$3,454.01") + [word("x", TYPE_X, 129)]
+        self.assertIsNone(_find_transaction_table(words))
+
+    def test_phrase_across_columns_falls_back(self):
+        words = header() + row(129, "01/05/2024", None, "$2,500.00", "$3,500.00") \
+            + [word("DIRECT DEPOSIT FROM EMPLOYER", DESCRIPTION_X, 129)]
+        self.assertIsNone(_find_transaction_table(words))
+
+    def test_no_dated_rows_falls_back(self):
+        words = header() + row(129, "Jan 5", "PAYROLL", "$2,500.00", "$3,500.00")
+        self.assertIsNone(_find_transaction_table(words))
+
+
+class FakePage:
+    """The two pdfplumber Page methods extract_tables() uses."""
+
+    def __init__(self, words, tables):
+        self.words, self.tables = words, tables
+
+    def extract_words(self):
+        return self.words
+
+    def extract_tables(self):
+        return self.tables
+
+
+class ExtractTablesTest(unittest.TestCase):
+
+    def test_extra_column_keeps_debit_sign(self):
+        words = header() + [word("Type", TYPE_X, 111)] \
+            + row(129, "01/07/2024", "AMAZON", "-$45.99", "$3,454.01") + [word("x", TYPE_X, 129)]
+        ruled = [["Date", "Description", "Type", "Amount", "Balance"],
+                 ["01/07/2024", "AMAZON", "x", "-$45.99", "$3,454.01"]]
+        [table] = extract_tables(FakePage(words, [ruled]))
+        [transaction] = parse_transaction_table(table)
+        self.assertEqual((transaction["amount"], transaction["type"]), (-45.99, "debit"))
+
+
+class MayFillMetadataTest(unittest.TestCase):
+
+    def setUp(self):
+        self.result = {}
+        extract_metadata("CHASE\nAccount Holder: John Doe\nOpening Balance $9,000.00", self.result)
+
+    def test_anchor_of_missing_field(self):
+        self.assertTrue(_may_fill_metadata("Closing Balance $12,410.01", self.result))
+        self.assertTrue(_may_fill_metadata("Acct# ****4521", self.result))
+        self.assertTrue(_may_fill_metadata("January 1, 2024 - January 31, 2024", self.result))
+
+    def test_only_found_fields_or_no_anchor(self):
+        self.assertFalse(_may_fill_metadata("Opening Balance $1.00\nName: Jane Roe", self.result))
+        self.assertFalse(_may_fill_metadata("01/09/2024 COFFEE -$4.50", self.result))
+
+
+class ParseAmountTest(unittest.TestCase):
+
+    def test_dollar_amounts(self):
+        self.assertEqual(parse_amount("$2,500.00"), (2500.0, "credit"))
+        self.assertEqual(parse_amount("-$45.99"), (-45.99, "debit"))
+        self.assertEqual(parse_amount("($5.00)"), (-5.0, "debit"))
+        self.assertEqual(parse_amount("5.00 DR"), (-5.0, "debit"))
+
+    def test_leading_sign_without_dollar_is_a_debit(self):
+        for amount in ("-€5.00", "-USD 5.00", "-EUR5.00", "-(5)"):
+            self.assertEqual(parse_amount(amount), (-5.0, "debit"), amount)
+        self.assertEqual(parse_amount("-£1,200.00"), (-1200.0, "debit"))
+
+    def test_other_currencies_are_credits(self):
+        self.assertEqual(parse_amount("USD 5.00"), (5.0, "credit"))
+
+    def test_amount_and_balance_read_numbers_alike(self):
+        for value in ("1 234.56", "$1,234.56", "12-34", "USD 5.00"):
+            self.assertEqual(abs(parse_amount(value)[0]), parse_balance(value), value)
+
+    def test_no_number(self):
+        self.assertEqual(parse_amount("n/a"), (None, None))
+        self.assertIsNone(parse_balance(""))
+
+
+if __name__ == "__main__":
+    unittest.main()